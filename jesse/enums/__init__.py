@@ -8,6 +8,20 @@ class trade_types:
     SHORT = 'short'
 
 
+class trade_type_codes:
+    """integer codes of trade_types, for cheap comparisons"""
+    LONG = 0
+    SHORT = 1
+
+
+class position_states:
+    """bit flags of Position.state"""
+    CLOSE = 0
+    OPEN = 1
+    LONG = 2
+    SHORT = 4
+
+
 class order_statuses:
     ACTIVE = 'ACTIVE'
     CANCELED = 'CANCELED'
@@ -564,24 +564,43 @@ def np_shift(arr: np.ndarray, num: int, fill_value=0):
     return result
 
 
-def round_price_for_live_mode(price, roundable_price):
+def price_round_precision_for_live_mode(price):
     """
-    Rounds price(s) based on exchange requirements
+    Number of decimals that prices are rounded to based on exchange requirements
 
     :param price: float
-    :param roundable_price: float | nd.array
-    :return: float | nd.array
+    :return: int
     """
     n = int(math.log10(price))
 
     if price < 1:
-        price_round_precision = abs(n - 4)
-    else:
-        price_round_precision = 3 - n
-        if price_round_precision < 0:
-            price_round_precision = 0
+        return abs(n - 4)
+
+    return max(3 - n, 0)
 
-    return np.round(roundable_price, price_round_precision)
+
+def qty_round_precision_for_live_mode(price):
+    """
+    Number of decimals that quantities are rounded to based on exchange requirements
+
+    :param price: float
+    :return: int
+    """
+    if price < 1:
+        return 0
+
+    return min(int(math.log10(price)) + 1, 3)
+
+
+def round_price_for_live_mode(price, roundable_price):
+    """
+    Rounds price(s) based on exchange requirements
+
+    :param price: float
+    :param roundable_price: float | nd.array
+    :return: float | nd.array
+    """
+    return np.round(roundable_price, price_round_precision_for_live_mode(price))
 
 
 def round_qty_for_live_mode(price, roundable_qty):
@@ -592,13 +611,19 @@ def round_qty_for_live_mode(price, roundable_qty):
     :param roundable_qty: float | nd.array
     :return: float | nd.array
     """
-    n = int(math.log10(price))
+    return np.round(roundable_qty, qty_round_precision_for_live_mode(price))
 
-    if price < 1:
-        qty_round_precision = 0
-    else:
-        qty_round_precision = n + 1
-        if qty_round_precision > 3:
-            qty_round_precision = 3
 
-    return np.round(roundable_qty, qty_round_precision)
+def round_orders_for_live_mode(price, orders):
+    """
+    Rounds both the qty and price columns of a (qty, price) orders
+    array in-place based on exchange requirements
+
+    :param price: float
+    :param orders: nd.array
+    :return: nd.array
+    """
+    np.round(orders[:, 0], qty_round_precision_for_live_mode(price), out=orders[:, 0])
+    np.round(orders[:, 1], price_round_precision_for_live_mode(price), out=orders[:, 1])
+
+    return orders
@@ -6,6 +6,14 @@ import numpy as np
 class CompletedTrade:
     """A trade is made when a position is opened AND closed."""
 
+    __slots__ = (
+        'id', 'strategy_name', 'strategy_version', 'symbol', 'exchange', 'type', 'timeframe',
+        'entry_price', 'exit_price', 'take_profit_at', 'stop_loss_at', 'qty', 'orders',
+        '_opening_side_type', '_qty_sums', '_cost_sums',
+        'opened_at', 'closed_at', 'entry_candle_timestamp', 'exit_candle_timestamp',
+        'reduced_at', 'reduction_timestamp', 'reduction_candle_timestamp',
+    )
+
     def __init__(self, attributes=None):
         self.id = ''
         self.strategy_name = ''
@@ -20,6 +28,11 @@ class CompletedTrade:
         self.stop_loss_at = np.nan
         self.qty = np.nan
         self.orders = []
+        # side_type of the first order, and running qty and qty*price
+        # totals of [entry, exit] orders; all kept by add_order()
+        self._opening_side_type = None
+        self._qty_sums = [0.0, 0.0]
+        self._cost_sums = [0.0, 0.0]
         self.opened_at = None
         self.closed_at = None
         self.entry_candle_timestamp = None
@@ -34,10 +47,32 @@ class CompletedTrade:
         for a in attributes:
             setattr(self, a, attributes[a])
 
+    def add_order(self, order):
+        # the first order opens the trade, so orders on its side are entries and the rest are exits
+        if self._opening_side_type is None:
+            self._opening_side_type = order.side_type
+        i = 0 if order.side_type == self._opening_side_type else 1
+        self._qty_sums[i] += order.qty_abs
+        self._cost_sums[i] += order.qty_abs * order.price
+
+        self.orders.append(order)
+
+    def entry_and_exit_stats(self):
+        """
+        Total entry qty plus the average entry and exit prices of the orders
+        added via add_order(), from the totals it has kept for each side
+
+        :return: (float, float, float)
+        """
+        qty_sums, cost_sums = self._qty_sums, self._cost_sums
+        entry_price = cost_sums[0] / qty_sums[0] if qty_sums[0] else np.nan
+        exit_price = cost_sums[1] / qty_sums[1] if qty_sums[1] else np.nan
+        return qty_sums[0], entry_price, exit_price
+
     def toJSON(self):
         orders = []
         for o in self.orders:
-            orders.append(o.__dict__)
+            orders.append(o.to_dict())
         return {
             "id": self.id,
             "strategy_name": self.strategy_name,
@@ -1,11 +1,14 @@
 import jesse.helpers as jh
 import jesse.services.selectors as selectors
 from jesse.config import config
-from jesse.enums import order_statuses, order_flags
+from jesse.enums import order_statuses, order_flags, sides, trade_type_codes
 from jesse.services.notifier import notify
 import jesse.services.logger as logger
 
 
+_SIDE_TYPE_CODES = {sides.BUY: trade_type_codes.LONG, sides.SELL: trade_type_codes.SHORT}
+
+
 class Order():
     def __init__(self, attributes=None):
         # id generated by Jesse for database usage
@@ -50,6 +53,60 @@ class Order():
                 )
             )
 
+    @property
+    def qty(self):
+        return self._qty
+
+    @qty.setter
+    def qty(self, value):
+        self._qty = value
+        self._qty_abs = abs(value)
+
+    @property
+    def side(self):
+        return self._side
+
+    @side.setter
+    def side(self, value):
+        self._side = value
+        self._side_type = _SIDE_TYPE_CODES.get(value)
+
+    @property
+    def side_type(self):
+        """
+        The trade_type_codes value of the trade type this side opens (None if side is not set)
+
+        :return: int
+        """
+        return self._side_type
+
+    @property
+    def qty_abs(self):
+        """
+        abs(self.qty), kept up to date whenever qty is set
+
+        :return: float
+        """
+        return self._qty_abs
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'exchange_id': self.exchange_id,
+            'symbol': self.symbol,
+            'exchange': self.exchange,
+            'side': self.side,
+            'type': self.type,
+            'flag': self.flag,
+            'qty': self.qty,
+            'price': self.price,
+            'status': self.status,
+            'created_at': self.created_at,
+            'executed_at': self.executed_at,
+            'canceled_at': self.canceled_at,
+            'role': self.role,
+        }
+
     def notify_submission(self):
         notify(
             '{} order: {}, {}, {}, {}, ${}'.format(
@@ -124,6 +181,14 @@ class Order():
         if p:
             p._on_canceled_order(self)
 
+        self._notify_status_change()
+
+    def _notify_status_change(self):
+        # only live mode waits for orders to settle
+        if jh.is_live():
+            from jesse.store import store
+            store.orders.notify_status_change()
+
     def execute(self):
         if self.is_canceled or self.is_executed:
             return
@@ -151,3 +216,5 @@ class Order():
 
         if p:
             p._on_executed_order(self)
+
+        self._notify_status_change()
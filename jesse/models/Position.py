@@ -1,7 +1,7 @@
 import jesse.helpers as jh
 import jesse.utils as ju
 import jesse.services.selectors as selectors
-from jesse.enums import trade_types, order_types, order_flags
+from jesse.enums import trade_types, order_types, order_flags, position_states
 from jesse.exceptions import EmptyPosition, OpenPositionError
 from jesse.models import Order
 from jesse.services import logger, notifier
@@ -29,6 +29,39 @@ class Position:
         for a in attributes:
             setattr(self, a, attributes[a])
 
+    @property
+    def qty(self):
+        return self._qty
+
+    @qty.setter
+    def qty(self, value):
+        self._qty = value
+        self._qty_abs = abs(value)
+        if value > 0:
+            self._state = position_states.OPEN | position_states.LONG
+        elif value < 0:
+            self._state = position_states.OPEN | position_states.SHORT
+        else:
+            self._state = position_states.CLOSE
+
+    @property
+    def qty_abs(self):
+        """
+        abs(self.qty), kept up to date whenever qty is set
+
+        :return: float
+        """
+        return self._qty_abs
+
+    @property
+    def state(self):
+        """
+        position_states bit flags of the position, kept up to date whenever qty is set
+
+        :return: int
+        """
+        return self._state
+
     @property
     def value(self):
         """
@@ -45,9 +78,9 @@ class Position:
 
         :return: str
         """
-        if self.qty > 0:
+        if self._state & position_states.LONG:
             return 'long'
-        if self.qty < 0:
+        if self._state & position_states.SHORT:
             return 'short'
 
         return 'close'
@@ -87,7 +120,7 @@ class Position:
 
         :return: bool
         """
-        return self.qty != 0
+        return self._state & position_states.OPEN != 0
 
     @property
     def is_close(self):
@@ -96,7 +129,7 @@ class Position:
 
         :return: bool
         """
-        return self.qty == 0
+        return self._state == position_states.CLOSE
 
     def _close(self, close_price):
         if self.is_open is False:
@@ -171,6 +171,9 @@ def simulator(candles, hyper_parameters=None):
     # add initial balance
     _save_daily_portfolio_balance()
 
+    # the mode doesn't change during a simulation, so resolve it once instead of per candle
+    show_progressbar = not jh.is_debugging() and not jh.should_execute_silently()
+
     with click.progressbar(length=length, label='Executing simulation...') as progressbar:
         for i in range(length):
             # update time
@@ -208,7 +211,7 @@ def simulator(candles, hyper_parameters=None):
                                                  with_generation=False)
 
             # update progressbar
-            if not jh.is_debugging() and not jh.should_execute_silently() and i % 60 == 0:
+            if show_progressbar and i % 60 == 0:
                 progressbar.update(60)
 
             # now that all new generated candles are ready, execute
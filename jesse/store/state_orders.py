@@ -1,3 +1,4 @@
+import threading
 from typing import List
 import pydash
 from jesse.config import config
@@ -11,6 +12,9 @@ class OrdersState:
 
         self.storage = {}
 
+        # notified whenever an order gets canceled or executed
+        self._status_changed = threading.Condition()
+
         for exchange in config['app']['trading_exchanges']:
             for symbol in config['app']['trading_symbols']:
                 key = '{}-{}'.format(exchange, symbol)
@@ -47,6 +51,26 @@ class OrdersState:
                 c += 1
         return c
 
+    def notify_status_change(self):
+        """
+        Wakes up whoever is waiting on an order's status (in livetrade, the WS thread
+        confirms cancellations while the strategy thread is waiting for them)
+        """
+        with self._status_changed:
+            self._status_changed.notify_all()
+
+    def wait_for_no_active_orders(self, exchange: str, symbol: str, timeout: float) -> bool:
+        """
+        Blocks until there are no active orders left for the exchange-symbol pair
+        or until the timeout (in seconds) is reached.
+
+        :return: bool -- whether active orders were settled in time
+        """
+        with self._status_changed:
+            return self._status_changed.wait_for(
+                lambda: self.count_active_orders(exchange, symbol) == 0, timeout
+            )
+
     def count(self, exchange, symbol) -> int:
         return len(self.get_orders(exchange, symbol))
 
@@ -2,22 +2,48 @@ from abc import ABC, abstractmethod
 from typing import List
 
 import numpy as np
-import pydash
-from time import sleep
 
 import jesse.helpers as jh
 import jesse.services.logger as logger
 import jesse.services.selectors as selectors
-from jesse.enums import sides, trade_types, order_roles
+from jesse.enums import sides, trade_types, order_roles, position_states
 from jesse import exceptions
 from jesse.models import CompletedTrade, Order
+from jesse.routes import router
 from jesse.services.broker import Broker
 from jesse.store import store
 
+# types accepted for (qty, price) points and lists of them
+_LIST_OR_TUPLE = (list, tuple)
+_SEQ_TYPES = (list, tuple, np.ndarray)
+
+# maps each broadcast message to the handler that other routes' strategies should call
+_BROADCAST_HANDLERS = {
+    'route-open-position': 'on_route_open_position',
+    'route-stop-loss': 'on_route_stop_loss',
+    'route-take-profit': 'on_route_take_profit',
+    'route-increased-position': 'on_route_increased_position',
+    'route-reduced-position': 'on_route_reduced_position',
+    'route-canceled': 'on_route_canceled',
+}
+
 
 class Strategy(ABC):
     """The parent strategy class which every strategy must extend"""
 
+    # attributes of the parent class live in slots; strategies (subclasses)
+    # still get a __dict__ for their own attributes
+    __slots__ = (
+        'id', 'name', 'symbol', 'exchange', 'timeframe', 'hp', 'index', 'vars', 'shared_vars',
+        'buy', '_buy', '_buy_sig', 'sell', '_sell', '_sell_sig',
+        'stop_loss', '_stop_loss', '_stop_loss_sig', 'take_profit', '_take_profit', '_take_profit_sig',
+        '_log_take_profit', '_log_take_profit_n', '_log_stop_loss', '_log_stop_loss_n',
+        '_open_position_orders', '_stop_loss_orders', '_take_profit_orders',
+        'trade', 'trades_count', '_initial_qty', '_is_executing', '_is_initiated',
+        '_current_candle_cache', '_candles_cache', 'position', 'broker',
+        '_mode_live', '_mode_backtest', '_mode_debug', '_mode_silent', '_mode_unit_testing', '_mode_test_drive',
+    )
+
     def __init__(self):
         self.id = jh.generate_unique_id()
         self.name = None
@@ -28,17 +54,27 @@ class Strategy(ABC):
 
         self.index = 0
         self.vars = {}
+        # store.vars is never replaced, so it's bound once instead of being a property
+        self.shared_vars = store.vars
 
         self.buy = None
         self._buy = None
+        self._buy_sig = None
         self.sell = None
         self._sell = None
+        self._sell_sig = None
         self.stop_loss = None
         self._stop_loss = None
+        self._stop_loss_sig = None
         self.take_profit = None
         self._take_profit = None
-        self._log_take_profit = None
-        self._log_stop_loss = None
+        self._take_profit_sig = None
+        # (qty, price) of take-profit and stop-loss points of the trade, kept in buffers
+        # that are reused across trades; only the first _log_*_n rows are in use
+        self._log_take_profit = np.empty((8, 2))
+        self._log_take_profit_n = 0
+        self._log_stop_loss = np.empty((8, 2))
+        self._log_stop_loss_n = 0
 
         self._open_position_orders = []
         self._stop_loss_orders = []
@@ -51,9 +87,22 @@ class Strategy(ABC):
         self._is_executing = False
         self._is_initiated = False
 
+        # in backtests, candles don't change during an execution; cached by current_candle and candles
+        self._current_candle_cache = None
+        self._candles_cache = None
+
         self.position = None
         self.broker = None
 
+        # the running mode never changes during a session, hence they're
+        # cached inside _init_objects() instead of being queried on each tick
+        self._mode_live = False
+        self._mode_backtest = False
+        self._mode_debug = False
+        self._mode_silent = False
+        self._mode_unit_testing = False
+        self._mode_test_drive = False
+
     def _init_objects(self):
         """
         This method gets called after right creating the Strategy object. It
@@ -63,6 +112,13 @@ class Strategy(ABC):
         self.position = selectors.get_position(self.exchange, self.symbol)
         self.broker = Broker(self.position, self.exchange, self.symbol, self.timeframe)
 
+        self._mode_live = jh.is_live()
+        self._mode_backtest = jh.is_backtesting()
+        self._mode_debug = jh.is_debugging()
+        self._mode_silent = jh.should_execute_silently()
+        self._mode_unit_testing = jh.is_unit_testing()
+        self._mode_test_drive = jh.is_test_driving()
+
     @property
     def is_reduced(self):
         """
@@ -87,27 +143,18 @@ class Strategy(ABC):
         Arguments:
             msg {str} -- [the message to broadcast]
         """
-        from jesse.routes import router
+        handler = _BROADCAST_HANDLERS[msg]
 
         for r in router.routes:
+            s = r.strategy
+
             # skip self
-            if r.strategy.id == self.id:
+            if s.id == self.id:
                 continue
 
-            if msg == 'route-open-position':
-                r.strategy.on_route_open_position(self)
-            elif msg == 'route-stop-loss':
-                r.strategy.on_route_stop_loss(self)
-            elif msg == 'route-take-profit':
-                r.strategy.on_route_take_profit(self)
-            elif msg == 'route-increased-position':
-                r.strategy.on_route_increased_position(self)
-            elif msg == 'route-reduced-position':
-                r.strategy.on_route_reduced_position(self)
-            elif msg == 'route-canceled':
-                r.strategy.on_route_canceled(self)
-
-            r.strategy._detect_and_handle_entry_and_exit_modifications()
+            getattr(s, handler)(self)
+
+            s._detect_and_handle_entry_and_exit_modifications()
 
     def _on_updated_position(self, order: Order):
         """handles executed order
@@ -119,7 +166,7 @@ class Strategy(ABC):
         """
         role = order.role
 
-        if role == order_roles.OPEN_POSITION and abs(self.position.qty) != abs(order.qty):
+        if role == order_roles.OPEN_POSITION and self.position.qty_abs != order.qty_abs:
             order.role = order_roles.INCREASE_POSITION
             role = order_roles.INCREASE_POSITION
 
@@ -153,7 +200,7 @@ class Strategy(ABC):
         # validation
         if self.buy is None:
             raise exceptions.InvalidStrategy('You forgot to set self.buy. example [qty, price]')
-        elif type(self.buy) not in [tuple, list]:
+        elif not isinstance(self.buy, _LIST_OR_TUPLE):
             raise exceptions.InvalidStrategy('self.buy must be either a list or a tuple. example: [qty, price]')
 
         self._prepare_buy()
@@ -178,87 +225,144 @@ class Strategy(ABC):
                 self._reset()
                 return
 
-        for o in self._buy:
+        self._submit_entry_orders(self._buy, sides.BUY)
+
+    def _submit_entry_orders(self, arr: np.ndarray, side: str):
+        """
+        Submits open-position orders for the (qty, price) points of arr. Each point is
+        submitted as a STOP, LIMIT or MARKET order based on where its price stands
+        compared to the current price.
+
+        :param arr: np.ndarray
+        :param side: str
+        """
+        broker = self.broker
+        role = order_roles.OPEN_POSITION
+        stop_order = broker.start_profit_at
+
+        # classify all points at once: 1 for STOP, -1 for LIMIT and 0 for MARKET
+        kinds = np.sign(arr[:, 1] - self.price)
+        if side == sides.BUY:
+            limit_order = broker.buy_at
+            market_order = broker.buy_at_market
+        else:
+            kinds = -kinds
+            limit_order = broker.sell_at
+            market_order = broker.sell_at_market
+
+        for (qty, price), kind in zip(arr.tolist(), kinds.tolist()):
             # STOP order
-            if o[1] > self.price:
-                self._open_position_orders.append(
-                    self.broker.start_profit_at(sides.BUY, o[0], o[1], order_roles.OPEN_POSITION)
-                )
+            if kind == 1:
+                self._open_position_orders.append(stop_order(side, qty, price, role))
             # LIMIT order
-            elif o[1] < self.price:
-                self._open_position_orders.append(
-                    self.broker.buy_at(o[0], o[1], order_roles.OPEN_POSITION)
-                )
+            elif kind == -1:
+                self._open_position_orders.append(limit_order(qty, price, role))
             # MARKET order
-            elif o[1] == self.price:
-                self._open_position_orders.append(
-                    self.broker.buy_at_market(o[0], order_roles.OPEN_POSITION)
-                )
+            elif kind == 0:
+                self._open_position_orders.append(market_order(qty, role))
 
     def _prepare_buy(self, make_copies=True):
         # create a copy in the placeholders variables so we can detect future modifications
         # also, make it list of orders even if there's only one, to make it easier to loop
-        if type(self.buy[0]) not in [list, tuple]:
+        if not isinstance(self.buy[0], _LIST_OR_TUPLE):
             self.buy = [self.buy]
         self.buy = self._convert_to_numpy_array(self.buy, 'self.buy')
 
         if make_copies:
-            self._buy = self.buy.copy()
+            self._buy = self._read_only_view(self.buy)
+            self._buy_sig = self._signature(self.buy)
 
     def _prepare_sell(self, make_copies=True):
         # create a copy in the placeholders variables so we can detect future modifications
         # also, make it list of orders even if there's only one, to make it easier to loop
-        if type(self.sell[0]) not in [list, tuple]:
+        if not isinstance(self.sell[0], _LIST_OR_TUPLE):
             self.sell = [self.sell]
         self.sell = self._convert_to_numpy_array(self.sell, 'self.sell')
 
         if make_copies:
-            self._sell = self.sell.copy()
+            self._sell = self._read_only_view(self.sell)
+            self._sell_sig = self._signature(self.sell)
 
     def _prepare_stop_loss(self, make_copies=True):
         # if it's numpy, then it has already been prepared
         if type(self.stop_loss) is np.ndarray:
             return
 
-        if type(self.stop_loss[0]) not in [list, tuple, np.ndarray]:
+        if not isinstance(self.stop_loss[0], _SEQ_TYPES):
             self.stop_loss = [self.stop_loss]
         self.stop_loss = self._convert_to_numpy_array(self.stop_loss, 'self.stop_loss')
 
         if make_copies:
-            self._stop_loss = self.stop_loss.copy()
-            self._log_stop_loss = self._stop_loss.copy()
+            self._stop_loss = self._read_only_view(self.stop_loss)
+            self._stop_loss_sig = self._signature(self.stop_loss)
+            self._log_stop_loss, self._log_stop_loss_n = self._fill_log(self._log_stop_loss, (), self._stop_loss)
 
     def _prepare_take_profit(self, make_copies=True):
         # if it's numpy, then it has already been prepared
         if type(self.take_profit) is np.ndarray:
             return
 
-        if type(self.take_profit[0]) not in [list, tuple, np.ndarray]:
+        if not isinstance(self.take_profit[0], _SEQ_TYPES):
             self.take_profit = [self.take_profit]
         self.take_profit = self._convert_to_numpy_array(self.take_profit, 'self.take_profit')
 
         if make_copies:
-            self._take_profit = self.take_profit.copy()
-            self._log_take_profit = self._take_profit.copy()
+            self._take_profit = self._read_only_view(self.take_profit)
+            self._take_profit_sig = self._signature(self.take_profit)
+            self._log_take_profit, self._log_take_profit_n = self._fill_log(
+                self._log_take_profit, (), self._take_profit
+            )
+
+    @staticmethod
+    def _fill_log(log: np.ndarray, executed_orders, points: np.ndarray):
+        """
+        Writes (qty, price) of executed orders followed by points into the log
+        buffer, which is replaced by one twice as big whenever it's too small.
+
+        :return: (np.ndarray, int) -- the buffer and its number of rows in use
+        """
+        n = len(executed_orders) + len(points)
+        if n > len(log):
+            size = len(log)
+            while size < n:
+                size *= 2
+            log = np.empty((size, 2))
+
+        for i, o in enumerate(executed_orders):
+            log[i] = o.qty_abs, o.price
+        log[len(executed_orders):n] = points
+
+        return log, n
+
+    @staticmethod
+    def _read_only_view(arr: np.ndarray) -> np.ndarray:
+        """
+        A non-writable view of arr. It's used for the placeholder variables instead
+        of a copy; modifications are detected by comparing fingerprints instead.
+        """
+        view = arr.view()
+        view.setflags(write=False)
+        return view
 
     @staticmethod
-    def _convert_to_numpy_array(arr, name):
+    def _signature(arr: np.ndarray) -> tuple:
+        """
+        A cheap fingerprint of an orders array. Comparing fingerprints is how
+        we detect if the user has modified entry/exit points since last time.
+        """
+        return arr.shape, arr.tobytes()
+
+    def _convert_to_numpy_array(self, arr, name):
         if type(arr) is np.ndarray:
             return arr
 
         try:
             # create numpy array from list
-            arr = np.array(arr, dtype=float)
+            arr = np.asarray(arr, dtype=np.float64)
 
-            if jh.is_live():
+            if self._mode_live:
                 # in livetrade mode, we'll need them rounded
-                price = arr[0][1]
-
-                prices = jh.round_price_for_live_mode(price, arr[:, 1])
-                qtys = jh.round_qty_for_live_mode(price, arr[:, 0])
-
-                arr[:, 0] = qtys
-                arr[:, 1] = prices
+                jh.round_orders_for_live_mode(arr[0][1], arr)
 
             return arr
         except ValueError:
@@ -272,13 +376,13 @@ class Strategy(ABC):
     def _validate_stop_loss(self):
         if self.stop_loss is None:
             raise exceptions.InvalidStrategy('You forgot to set self.stop_loss. example [qty, price]')
-        elif type(self.stop_loss) not in [tuple, list, np.ndarray]:
+        elif not isinstance(self.stop_loss, _SEQ_TYPES):
             raise exceptions.InvalidStrategy('self.stop_loss must be either a list or a tuple. example: [qty, price]')
 
     def _validate_take_profit(self):
         if self.take_profit is None:
             raise exceptions.InvalidStrategy('You forgot to set self.take_profit. example [qty, price]')
-        elif type(self.take_profit) not in [tuple, list, np.ndarray]:
+        elif not isinstance(self.take_profit, _SEQ_TYPES):
             raise exceptions.InvalidStrategy('self.take_profit must be either a list or a tuple. example: [qty, price]')
 
     def _execute_short(self):
@@ -287,7 +391,7 @@ class Strategy(ABC):
         # validation
         if self.sell is None:
             raise exceptions.InvalidStrategy('You forgot to set self.sell. example [qty, price]')
-        elif type(self.sell) not in [tuple, list]:
+        elif not isinstance(self.sell, _LIST_OR_TUPLE):
             raise exceptions.InvalidStrategy('self.sell must be either a list or a tuple. example: [qty, price]')
 
         self._prepare_sell()
@@ -307,22 +411,7 @@ class Strategy(ABC):
                 self._reset()
                 return
 
-        for o in self._sell:
-            # STOP order
-            if o[1] < self.price:
-                self._open_position_orders.append(
-                    self.broker.start_profit_at(sides.SELL, o[0], o[1], order_roles.OPEN_POSITION)
-                )
-            # LIMIT order
-            elif o[1] > self.price:
-                self._open_position_orders.append(
-                    self.broker.sell_at(o[0], o[1], order_roles.OPEN_POSITION)
-                )
-            # MARKET order
-            elif o[1] == self.price:
-                self._open_position_orders.append(
-                    self.broker.sell_at_market(o[0], order_roles.OPEN_POSITION)
-                )
+        self._submit_entry_orders(self._sell, sides.SELL)
 
     @abstractmethod
     def go_long(self):
@@ -350,20 +439,24 @@ class Strategy(ABC):
 
         self.on_cancel()
 
-        if not jh.is_unit_testing() and not jh.is_live():
+        if not self._mode_unit_testing and not self._mode_live:
             store.orders.storage['{}-{}'.format(self.exchange, self.symbol)].clear()
 
     def _reset(self):
         self.buy = None
         self._buy = None
+        self._buy_sig = None
         self.sell = None
         self._sell = None
+        self._sell_sig = None
         self.stop_loss = None
         self._stop_loss = None
+        self._stop_loss_sig = None
         self.take_profit = None
         self._take_profit = None
-        self._log_take_profit = None
-        self._log_stop_loss = None
+        self._take_profit_sig = None
+        self._log_take_profit_n = 0
+        self._log_stop_loss_n = 0
 
         self._open_position_orders = []
         self._stop_loss_orders = []
@@ -406,118 +499,84 @@ class Strategy(ABC):
 
         if self.is_long:
             # prepare format
-            if type(self.buy[0]) not in [list, tuple, np.ndarray]:
+            if not isinstance(self.buy[0], _SEQ_TYPES):
                 self.buy = [self.buy]
-            self.buy = np.array(self.buy, dtype=float)
+            self.buy = np.asarray(self.buy, dtype=np.float64)
 
             # if entry has been modified
-            if not np.array_equal(self.buy, self._buy):
-                self._buy = self.buy.copy()
-
-                # cancel orders
-                for o in self._open_position_orders:
-                    if o.is_active or o.is_queued:
-                        self.broker.cancel_order(o.id)
-
-                # clean orders array but leave executed ones
-                self._open_position_orders = [o for o in self._open_position_orders if o.is_executed]
-                for o in self._buy:
-                    # STOP order
-                    if o[1] > self.price:
-                        self._open_position_orders.append(
-                            self.broker.start_profit_at(sides.BUY, o[0], o[1], order_roles.OPEN_POSITION)
-                        )
-                    # LIMIT order
-                    elif o[1] < self.price:
-                        self._open_position_orders.append(
-                            self.broker.buy_at(o[0], o[1], order_roles.OPEN_POSITION)
-                        )
-                    # MARKET order
-                    elif o[1] == self.price:
-                        self._open_position_orders.append(
-                            self.broker.buy_at_market(o[0], order_roles.OPEN_POSITION)
-                        )
+            sig = self._signature(self.buy)
+            if sig != self._buy_sig:
+                self._buy = self._read_only_view(self.buy)
+                self._buy_sig = sig
+
+                # cancel orders but leave executed ones
+                self._open_position_orders = self._cancel_unexecuted_orders(self._open_position_orders)
+                self._submit_entry_orders(self._buy, sides.BUY)
 
         elif self.is_short:
             # prepare format
-            if type(self.sell[0]) not in [list, tuple, np.ndarray]:
+            if not isinstance(self.sell[0], _SEQ_TYPES):
                 self.sell = [self.sell]
-            self.sell = np.array(self.sell, dtype=float)
+            self.sell = np.asarray(self.sell, dtype=np.float64)
 
             # if entry has been modified
-            if not np.array_equal(self.sell, self._sell):
-                self._sell = self.sell.copy()
-
-                # cancel orders
-                for o in self._open_position_orders:
-                    if o.is_active or o.is_queued:
-                        self.broker.cancel_order(o.id)
-
-                # clean orders array but leave executed ones
-                self._open_position_orders = [o for o in self._open_position_orders if o.is_executed]
-
-                for o in self._sell:
-                    # STOP order
-                    if o[1] > self.price:
-                        self._open_position_orders.append(
-                            self.broker.start_profit_at(sides.BUY, o[0], o[1], order_roles.OPEN_POSITION)
-                        )
-                    # LIMIT order
-                    elif o[1] < self.price:
-                        self._open_position_orders.append(
-                            self.broker.sell_at(o[0], o[1], order_roles.OPEN_POSITION)
-                        )
-                    # MARKET order
-                    elif o[1] == self.price:
-                        self._open_position_orders.append(
-                            self.broker.sell_at_market(o[0], order_roles.OPEN_POSITION)
-                        )
+            sig = self._signature(self.sell)
+            if sig != self._sell_sig:
+                self._sell = self._read_only_view(self.sell)
+                self._sell_sig = sig
+
+                # cancel orders but leave executed ones
+                self._open_position_orders = self._cancel_unexecuted_orders(self._open_position_orders)
+                self._submit_entry_orders(self._sell, sides.SELL)
 
         if self.position.is_open and self.take_profit is not None:
-            self._validate_take_profit()
-            self._prepare_take_profit(False)
+            # a numpy array has already been validated and prepared; only a
+            # newly assigned take-profit needs to go through them again
+            if type(self.take_profit) is not np.ndarray:
+                self._validate_take_profit()
+                self._prepare_take_profit(False)
 
             # if _take_profit has been modified
-            if not np.array_equal(self.take_profit, self._take_profit):
-                self._take_profit = self.take_profit.copy()
-
-                # cancel orders
-                for o in self._take_profit_orders:
-                    if o.is_active or o.is_queued:
-                        self.broker.cancel_order(o.id)
-
-                # clean orders array but leave executed ones
-                self._take_profit_orders = [o for o in self._take_profit_orders if o.is_executed]
-                self._log_take_profit = []
-                for s in self._take_profit_orders:
-                    self._log_take_profit.append(
-                        (abs(s.qty), s.price)
-                    )
-                for o in self._take_profit:
-                    self._log_take_profit.append(o)
+            sig = self._signature(self.take_profit)
+            if sig != self._take_profit_sig:
+                self._take_profit = self._read_only_view(self.take_profit)
+                self._take_profit_sig = sig
+
+                # cancel orders but leave executed ones
+                self._take_profit_orders = self._cancel_unexecuted_orders(self._take_profit_orders)
+
+                # log executed orders followed by the new points
+                self._log_take_profit, self._log_take_profit_n = self._fill_log(
+                    self._log_take_profit, self._take_profit_orders, self._take_profit
+                )
 
-                    if o[1] == self.price:
-                        if self.is_long:
+                broker = self.broker
+                price = self.price
+                is_long = self.is_long
+                is_short = self.is_short
+                for o in self._take_profit:
+                    if o[1] == price:
+                        if is_long:
                             self._take_profit_orders.append(
-                                self.broker.sell_at_market(o[0], role=order_roles.CLOSE_POSITION)
+                                broker.sell_at_market(o[0], role=order_roles.CLOSE_POSITION)
                             )
-                        elif self.is_short:
+                        elif is_short:
                             self._take_profit_orders.append(
-                                self.broker.buy_at_market(o[0], role=order_roles.CLOSE_POSITION)
+                                broker.buy_at_market(o[0], role=order_roles.CLOSE_POSITION)
                             )
                     else:
-                        if (self.is_long and o[1] > self.price) or (self.is_short and o[1] < self.price):
+                        if (is_long and o[1] > price) or (is_short and o[1] < price):
 
                             self._take_profit_orders.append(
-                                self.broker.reduce_position_at(
+                                broker.reduce_position_at(
                                     o[0],
                                     o[1],
                                     order_roles.CLOSE_POSITION
                                 )
                             )
-                        elif (self.is_long and o[1] < self.price) or (self.is_short and o[1] > self.price):
+                        elif (is_long and o[1] < price) or (is_short and o[1] > price):
                             self._take_profit_orders.append(
-                                self.broker.stop_loss_at(
+                                broker.stop_loss_at(
                                     o[0],
                                     o[1],
                                     order_roles.CLOSE_POSITION
@@ -525,41 +584,42 @@ class Strategy(ABC):
                             )
 
         if self.position.is_open and self.stop_loss is not None:
-            self._validate_stop_loss()
-            self._prepare_stop_loss(False)
+            if type(self.stop_loss) is not np.ndarray:
+                self._validate_stop_loss()
+                self._prepare_stop_loss(False)
 
             # if stop_loss has been modified
-            if not np.array_equal(self.stop_loss, self._stop_loss):
+            sig = self._signature(self.stop_loss)
+            if sig != self._stop_loss_sig:
                 # prepare format
-                self._stop_loss = self.stop_loss.copy()
-
-                # cancel orders
-                for o in self._stop_loss_orders:
-                    if o.is_active or o.is_queued:
-                        self.broker.cancel_order(o.id)
-
-                # clean orders array but leave executed ones
-                self._stop_loss_orders = [o for o in self._stop_loss_orders if o.is_executed]
-                self._log_stop_loss = []
-                for s in self._stop_loss_orders:
-                    self._log_stop_loss.append(
-                        (abs(s.qty), s.price)
-                    )
-                for o in self._stop_loss:
-                    self._log_stop_loss.append(o)
+                self._stop_loss = self._read_only_view(self.stop_loss)
+                self._stop_loss_sig = sig
+
+                # cancel orders but leave executed ones
+                self._stop_loss_orders = self._cancel_unexecuted_orders(self._stop_loss_orders)
+
+                # log executed orders followed by the new points
+                self._log_stop_loss, self._log_stop_loss_n = self._fill_log(
+                    self._log_stop_loss, self._stop_loss_orders, self._stop_loss
+                )
 
-                    if o[1] == self.price:
-                        if self.is_long:
+                broker = self.broker
+                price = self.price
+                is_long = self.is_long
+                is_short = self.is_short
+                for o in self._stop_loss:
+                    if o[1] == price:
+                        if is_long:
                             self._stop_loss_orders.append(
-                                self.broker.sell_at_market(o[0], role=order_roles.CLOSE_POSITION)
+                                broker.sell_at_market(o[0], role=order_roles.CLOSE_POSITION)
                             )
-                        elif self.is_short:
+                        elif is_short:
                             self._stop_loss_orders.append(
-                                self.broker.buy_at_market(o[0], role=order_roles.CLOSE_POSITION)
+                                broker.buy_at_market(o[0], role=order_roles.CLOSE_POSITION)
                             )
                     else:
                         self._stop_loss_orders.append(
-                            self.broker.stop_loss_at(
+                            broker.stop_loss_at(
                                 o[0],
                                 o[1],
                                 order_roles.CLOSE_POSITION
@@ -568,9 +628,26 @@ class Strategy(ABC):
 
         # validations: stop-loss and take-profit should not be the same
         if self.position.is_open:
-            if (self.stop_loss is not None and self.take_profit is not None) and np.array_equal(self.stop_loss, self.take_profit):
+            if (self.stop_loss is not None and self.take_profit is not None) and self._stop_loss_sig == self._take_profit_sig:
                 raise exceptions.InvalidStrategy('stop-loss and take-profit should not be exactly the same. Just use either one of them and it will do.')
 
+    def _cancel_unexecuted_orders(self, orders: List[Order]) -> List[Order]:
+        """
+        Cancels active and queued orders in a single pass and
+        returns the ones that have already been executed.
+
+        :param orders: List[Order]
+        :return: List[Order]
+        """
+        executed = []
+        for o in orders:
+            if o.is_executed:
+                executed.append(o)
+            elif o.is_active or o.is_queued:
+                self.broker.cancel_order(o.id)
+
+        return executed
+
     def update_position(self):
         pass
 
@@ -579,31 +656,23 @@ class Strategy(ABC):
         if not self._is_initiated:
             self._is_initiated = True
 
-        if jh.is_live() and jh.is_debugging():
+        if self._mode_live and self._mode_debug:
             logger.info('Executing  {}-{}-{}-{}'.format(self.name, self.exchange, self.symbol, self.timeframe))
 
         # for caution to make sure testing on livetrade won't bleed your account
-        if jh.is_test_driving() and store.completed_trades.count >= 2:
+        if self._mode_test_drive and store.completed_trades.count >= 2:
             logger.info('Maximum allowed trades in test-drive mode is reached')
             return
 
-        if self._open_position_orders != [] and self.should_cancel():
+        if self._open_position_orders and self.should_cancel():
             self._execute_cancel()
 
             # make sure order cancellation response is received via WS
-            if jh.is_live():
-                # sleep a little until cancel is received via WS
-                sleep(0.1)
-                # just in case, sleep some more if necessary
-                for _ in range(20):
-                    if store.orders.count_active_orders(self.exchange, self.symbol) == 0:
-                        break
-
-                    logger.info('sleeping 0.2 more seconds...')
-                    sleep(0.2)
+            if self._mode_live:
+                settled = store.orders.wait_for_no_active_orders(self.exchange, self.symbol, timeout=4)
 
                 # If it's still not cancelled, something is wrong. Handle cancellation failure
-                if store.orders.count_active_orders(self.exchange, self.symbol) != 0:
+                if not settled:
                     raise exceptions.ExchangeNotResponding(
                         'The exchange did not respond as expected'
                     )
@@ -611,21 +680,26 @@ class Strategy(ABC):
         if self.position.is_open:
             self._update_position()
 
-        if jh.is_backtesting() or jh.is_unit_testing():
+        if self._mode_backtest or self._mode_unit_testing:
             store.orders.execute_pending_market_orders()
 
-        if self.position.is_close and self._open_position_orders == []:
-            # validation
-            if self.should_short() and self.should_long():
-                raise exceptions.ConflictingRules(
-                    'should_short and should_long should not be true at the same time.'
-                )
+        if self._open_position_orders or self.position.is_open:
+            return
+
+        # evaluate each rule only once
+        should_short = self.should_short()
+        should_long = self.should_long()
 
-            if self.should_long():
-                self._execute_long()
+        # validation
+        if should_short and should_long:
+            raise exceptions.ConflictingRules(
+                'should_short and should_long should not be true at the same time.'
+            )
 
-            if self.should_short():
-                self._execute_short()
+        if should_long:
+            self._execute_long()
+        elif should_short:
+            self._execute_short()
 
     def _on_open_position(self):
         logger.info('Detected open position')
@@ -701,7 +775,7 @@ class Strategy(ABC):
         pass
 
     def _on_stop_loss(self):
-        if not jh.should_execute_silently() or jh.is_debugging():
+        if not self._mode_silent or self._mode_debug:
             logger.info('Yikes! stop-loss has been executed.')
 
         self._broadcast('route-stop-loss')
@@ -717,7 +791,7 @@ class Strategy(ABC):
         pass
 
     def _on_take_profit(self):
-        if not jh.should_execute_silently() or jh.is_debugging():
+        if not self._mode_silent or self._mode_debug:
             logger.info("Sweet! Take profit order has been executed.")
 
         self._broadcast('route-take-profit')
@@ -733,7 +807,7 @@ class Strategy(ABC):
         pass
 
     def _on_increased_position(self):
-        if not jh.should_execute_silently() or jh.is_debugging():
+        if not self._mode_silent or self._mode_debug:
             logger.info("Position size increased.")
 
         self._open_position_orders = []
@@ -756,7 +830,7 @@ class Strategy(ABC):
         """
         prepares for on_reduced_position() is implemented by user
         """
-        if not jh.should_execute_silently() or jh.is_debugging():
+        if not self._mode_silent or self._mode_debug:
             logger.info("Position size reduced.")
 
         self._open_position_orders = []
@@ -827,6 +901,8 @@ class Strategy(ABC):
             return
 
         self._is_executing = True
+        self._current_candle_cache = None
+        self._candles_cache = None
 
         self.prepare()
         self._check()
@@ -840,30 +916,31 @@ class Strategy(ABC):
         This block will not execute in live use as a live
         Jesse is never ending.
         """
-        if not jh.should_execute_silently() or jh.is_debugging():
+        if not self._mode_silent or self._mode_debug:
             logger.info("Terminating strategy...")
 
         self.terminate()
 
         self._detect_and_handle_entry_and_exit_modifications()
 
-        # fake execution of market orders in backtest simulation
-        if not jh.is_live():
-            store.orders.execute_pending_market_orders()
-
-        if jh.is_live():
+        if self._mode_live:
             return
 
-        if self.position.is_open:
+        # fake execution of market orders in backtest simulation
+        store.orders.execute_pending_market_orders()
+
+        position = self.position
+        if position.is_open:
+            pnl = position.pnl
+            current_price = position.current_price
             store.app.total_open_trades += 1
-            store.app.total_open_pl += self.position.pnl
+            store.app.total_open_pl += pnl
             logger.info(
                 "Closed open {}-{} position at {} with PNL: {}({}%) because we reached the end of the backtest session.".format(
-                    self.exchange, self.symbol, self.position.current_price, self.position.pnl,
-                    self.position.pnl_percentage
+                    self.exchange, self.symbol, current_price, pnl, position.pnl_percentage
                 )
             )
-            self.position._close(self.position.current_price)
+            position._close(current_price)
             self._execute_cancel()
             return
 
@@ -891,7 +968,18 @@ class Strategy(ABC):
 
         :return: np.ndarray
         """
-        return store.candles.get_current_candle(self.exchange, self.symbol, self.timeframe).copy()
+        # outside of an execution (e.g. orders getting executed by price changes)
+        # the candle might have changed since last time, and in live mode it keeps
+        # changing during the execution too, hence no caching
+        if not self._is_executing or self._mode_live:
+            return store.candles.get_current_candle(self.exchange, self.symbol, self.timeframe).copy()
+
+        if self._current_candle_cache is None:
+            self._current_candle_cache = store.candles.get_current_candle(
+                self.exchange, self.symbol, self.timeframe
+            ).copy()
+
+        return self._current_candle_cache
 
     @property
     def open(self):
@@ -950,7 +1038,14 @@ class Strategy(ABC):
 
         :return: np.ndarray
         """
-        return store.candles.get_candles(self.exchange, self.symbol, self.timeframe)
+        # same as current_candle, only cached during backtest executions
+        if not self._is_executing or self._mode_live:
+            return store.candles.get_candles(self.exchange, self.symbol, self.timeframe)
+
+        if self._candles_cache is None:
+            self._candles_cache = store.candles.get_candles(self.exchange, self.symbol, self.timeframe)
+
+        return self._candles_cache
 
     def get_candles(self, exchange: str, symbol: str, timeframe: str) -> np.ndarray:
         """
@@ -1004,7 +1099,7 @@ class Strategy(ABC):
         """
         if role == order_roles.OPEN_POSITION:
             self.trade = CompletedTrade()
-            self.trade.orders = [order]
+            self.trade.add_order(order)
             self.trade.timeframe = self.timeframe
             self.trade.id = order.id
             self.trade.strategy_name = self.name
@@ -1015,70 +1110,33 @@ class Strategy(ABC):
             self.trade.opened_at = jh.now()
             self.trade.entry_candle_timestamp = self.current_candle[0]
         elif role == order_roles.INCREASE_POSITION:
-            self.trade.orders.append(order)
+            self.trade.add_order(order)
             self.trade.qty += order.qty
         elif role == order_roles.REDUCE_POSITION:
-            self.trade.orders.append(order)
+            self.trade.add_order(order)
             self.trade.qty += order.qty
         elif role == order_roles.CLOSE_POSITION:
             self.trade.exit_candle_timestamp = self.current_candle[0]
-            self.trade.orders.append(order)
+            self.trade.add_order(order)
 
             # calculate average stop-loss price
-            sum_price = 0
-            sum_qty = 0
-            if self._log_stop_loss is not None:
-                for l in self._log_stop_loss:
-                    sum_qty += abs(l[0])
-                    sum_price += abs(l[0]) * l[1]
-                self.trade.stop_loss_at = sum_price / sum_qty
+            if self._log_stop_loss_n:
+                log = self._log_stop_loss[:self._log_stop_loss_n]
+                self.trade.stop_loss_at = self._average_price(log[:, 0], log[:, 1])
             else:
                 self.trade.stop_loss_at = np.nan
 
             # calculate average take-profit price
-            sum_price = 0
-            sum_qty = 0
-            if self._log_take_profit is not None:
-                for l in self._log_take_profit:
-                    sum_qty += abs(l[0])
-                    sum_price += abs(l[0]) * l[1]
-                self.trade.take_profit_at = sum_price / sum_qty
+            if self._log_take_profit_n:
+                log = self._log_take_profit[:self._log_take_profit_n]
+                self.trade.take_profit_at = self._average_price(log[:, 0], log[:, 1])
             else:
                 self.trade.take_profit_at = np.nan
 
-            # calculate average entry_price price
-            sum_price = 0
-            sum_qty = 0
-            for l in self.trade.orders:
-                if not l.is_executed:
-                    continue
-
-                if jh.side_to_type(l.side) != self.trade.type:
-                    continue
-
-                sum_qty += abs(l.qty)
-                sum_price += abs(l.qty) * l.price
-            self.trade.entry_price = sum_price / sum_qty
-
-            # calculate average exit_price
-            sum_price = 0
-            sum_qty = 0
-            for l in self.trade.orders:
-                if not l.is_executed:
-                    continue
-
-                if jh.side_to_type(l.side) == self.trade.type:
-                    continue
-
-                sum_qty += abs(l.qty)
-                sum_price += abs(l.qty) * l.price
-            self.trade.exit_price = sum_price / sum_qty
+            # calculate total qty, and average entry and exit prices
+            self.trade.qty, self.trade.entry_price, self.trade.exit_price = self.trade.entry_and_exit_stats()
 
             self.trade.closed_at = jh.now()
-            self.trade.qty = pydash.sum_by(
-                filter(lambda o: o.side == jh.type_to_side(self.trade.type), self.trade.orders),
-                lambda o: abs(o.qty)
-            )
 
             store.completed_trades.add_trade(self.trade)
             self.trade = None
@@ -1086,35 +1144,41 @@ class Strategy(ABC):
 
     @property
     def is_long(self):
-        return self.position.type == 'long'
+        return self.position.state & position_states.LONG != 0
 
     @property
     def is_short(self):
-        return self.position.type == 'short'
+        return self.position.state & position_states.SHORT != 0
 
     @property
     def is_open(self):
-        return self.position.is_open
+        return self.position.state & position_states.OPEN != 0
 
     @property
     def is_close(self):
-        return self.position.is_close
+        return self.position.state == position_states.CLOSE
+
+    @staticmethod
+    def _average_price(qty: np.ndarray, price: np.ndarray) -> float:
+        """
+        Average of prices weighted by the size of their quantities
+        """
+        qty = np.abs(qty)
+        return qty @ price / qty.sum()
 
     @property
     def average_stop_loss(self) -> float:
         if self._stop_loss is None:
             raise exceptions.InvalidStrategy('You cannot access self.average_stop_loss before setting self.stop_loss')
 
-        arr = self._stop_loss
-        return (np.abs(arr[:, 0] * arr[:, 1])).sum() / np.abs(arr[:, 0]).sum()
+        return self._average_price(self._stop_loss[:, 0], self._stop_loss[:, 1])
 
     @property
     def average_take_profit(self) -> float:
         if self._take_profit is None:
             raise exceptions.InvalidStrategy('You cannot access self.average_take_profit before setting self.take_profit')
 
-        arr = self._take_profit
-        return (np.abs(arr[:, 0] * arr[:, 1])).sum() / np.abs(arr[:, 0]).sum()
+        return self._average_price(self._take_profit[:, 0], self._take_profit[:, 1])
 
     @property
     def average_entry_price(self):
@@ -1129,20 +1193,18 @@ class Strategy(ABC):
         else:
             return None
 
-        return (np.abs(arr[:, 0] * arr[:, 1])).sum() / np.abs(arr[:, 0]).sum()
+        return self._average_price(arr[:, 0], arr[:, 1])
 
     def liquidate(self):
         """
         closes open position with a MARKET order
         """
-        if self.position.is_close:
+        position = self.position
+        if position.is_close:
             return
 
-        if self.position.pnl > 0:
-            self.take_profit = self.position.qty, self.price
+        target = position.qty, position.current_price
+        if position.pnl > 0:
+            self.take_profit = target
         else:
-            self.stop_loss = self.position.qty, self.price
-
-    @property
-    def shared_vars(self):
-        return store.vars
+            self.stop_loss = target
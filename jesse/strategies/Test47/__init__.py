@@ -0,0 +1,38 @@
+from jesse.strategies import Strategy
+
+
+# test_modifying_entry_of_short_position_after_opening
+class Test47(Strategy):
+    def should_long(self):
+        return False
+
+    def should_short(self):
+        return self.price == 10
+
+    def go_long(self):
+        pass
+
+    def go_short(self):
+        qty = 1
+        self.sell = qty, 10
+        self.stop_loss = qty, 20
+        self.take_profit = qty, 5
+
+    def update_position(self):
+        if self.price == 12:
+            # above the current price: LIMIT sell, below it: STOP sell
+            self.sell = [
+                (1, 14),
+                (1, 11),
+            ]
+            self.stop_loss = 2, 20
+        elif self.price == 13:
+            self.vars['resubmitted_orders'] = [
+                (o.side, o.type, o.price) for o in self._open_position_orders if o.is_active
+            ]
+
+    def should_cancel(self):
+        return False
+
+    def filters(self):
+        return []
@@ -0,0 +1,30 @@
+from jesse.strategies import Strategy
+
+
+# test_modifying_take_profit_in_place_after_opening_position
+class Test48(Strategy):
+    def should_long(self):
+        return self.price < 7
+
+    def should_short(self):
+        return False
+
+    def go_long(self):
+        qty = 1.5
+        self.buy = qty, 7
+        self.stop_loss = qty, 5
+        self.take_profit = qty, 11
+
+    def go_short(self):
+        pass
+
+    def should_cancel(self):
+        return False
+
+    def filters(self):
+        return []
+
+    def update_position(self):
+        if self.price == 10:
+            # edit the (already prepared) numpy array instead of assigning a new value
+            self.take_profit[0, 1] = 16
@@ -0,0 +1,36 @@
+from jesse.strategies import Strategy
+
+
+# test_taking_profit_at_many_points_and_modifying_them_after_partial_fills
+class Test49(Strategy):
+    def should_long(self):
+        return self.price < 7 or (self.trades_count == 1 and self.price == 41)
+
+    def should_short(self):
+        return False
+
+    def go_long(self):
+        if self.trades_count == 0:
+            qty = 10
+            self.buy = qty, 7
+            self.stop_loss = qty, 5
+            # more points than the initial size of the log buffers
+            self.take_profit = [(1, p) for p in range(11, 21)]
+        else:
+            qty = 1
+            self.buy = qty, self.price
+            self.stop_loss = qty, 30
+            self.take_profit = qty, 50
+
+    def go_short(self):
+        pass
+
+    def should_cancel(self):
+        return False
+
+    def filters(self):
+        return []
+
+    def update_position(self):
+        if self.trades_count == 0 and self.price == 16:
+            self.take_profit = [(1, p) for p in range(21, 21 + int(self.position.qty))]
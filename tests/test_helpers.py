@@ -326,3 +326,17 @@ def test_round_qty_for_live_mode():
         jh.round_qty_for_live_mode(6700.123456, np.array([0.123456, 0.124456])),
         np.array([0.123, 0.124])
     )
+
+
+def test_round_orders_for_live_mode():
+    orders = np.array([[100.0003209123456, 0.0003209123456], [100.0004209123456, 0.0004209123456]])
+    rounded = jh.round_orders_for_live_mode(0.0003209123456, orders)
+    np.testing.assert_equal(rounded, np.array([[100, 0.0003209], [100, 0.0004209]]))
+    # rounding happens in-place
+    assert rounded is orders
+
+    orders = np.array([[0.123456, 6700.123456], [0.124456, 1000.123456]])
+    np.testing.assert_equal(
+        jh.round_orders_for_live_mode(6700.123456, orders),
+        np.array([[0.123, 6700], [0.124, 1000]])
+    )
@@ -1,6 +1,6 @@
 from jesse.models import Order
 import jesse.helpers as jh
-from jesse.enums import order_types, sides, order_statuses
+from jesse.enums import order_types, sides, order_statuses, trade_type_codes
 
 
 def test_cancel_order():
@@ -42,3 +42,28 @@ def test_execute_order():
 
     assert order.is_executed is True
     assert order.executed_at == jh.now()
+
+
+def test_order_qty_abs():
+    order = Order({
+        'id': jh.generate_unique_id(),
+        'symbol': 'BTCUSD',
+        'type': order_types.LIMIT,
+        'price': 129.33,
+        'qty': -10.2041,
+        'side': sides.SELL,
+        'status': order_statuses.ACTIVE,
+        'created_at': jh.now(),
+    })
+
+    assert order.qty == -10.2041
+    assert order.qty_abs == 10.2041
+    assert order.to_dict()['qty'] == -10.2041
+
+
+def test_order_side_type():
+    buy = Order({'id': jh.generate_unique_id(), 'symbol': 'BTCUSD', 'qty': 1, 'price': 10, 'side': sides.BUY})
+    sell = Order({'id': jh.generate_unique_id(), 'symbol': 'BTCUSD', 'qty': -1, 'price': 10, 'side': sides.SELL})
+
+    assert buy.side_type == trade_type_codes.LONG
+    assert sell.side_type == trade_type_codes.SHORT
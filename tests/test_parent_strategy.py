@@ -6,7 +6,7 @@ import pytest
 import jesse.helpers as jh
 import jesse.services.selectors as selectors
 from jesse.config import reset_config
-from jesse.enums import exchanges, timeframes, order_roles, order_types
+from jesse.enums import exchanges, timeframes, order_roles, order_types, sides
 from jesse.factories import fake_range_candle, fake_range_candle_from_range_prices
 from jesse.models import Order
 from jesse.models import CompletedTrade
@@ -464,6 +464,26 @@ def test_taking_profit_at_multiple_points():
     assert t1.holding_period == 8 * 60
 
 
+def test_taking_profit_at_many_points_and_modifying_them_after_partial_fills():
+    single_route_backtest('Test49')
+
+    assert len(store.completed_trades.trades) == 2
+    t1: CompletedTrade = store.completed_trades.trades[0]
+    t2: CompletedTrade = store.completed_trades.trades[1]
+
+    # 6 take-profit points (11 to 16) got executed before the remaining 4 were moved to 21-24
+    assert t1.entry_price == 7
+    assert t1.qty == 10
+    assert t1.take_profit_at == (sum(range(11, 17)) + sum(range(21, 25))) / 10
+    assert t1.exit_price == t1.take_profit_at
+    assert t1.stop_loss_at == 5
+
+    # the next trade's averages have no leftovers of the previous one
+    assert t2.entry_price == 41
+    assert t2.take_profit_at == 50
+    assert t2.stop_loss_at == 30
+
+
 def test_stop_loss_at_multiple_points():
     set_up([
         (exchanges.SANDBOX, 'BTCUSD', timeframes.MINUTE_1, 'Test11'),
@@ -500,6 +520,27 @@ def test_modifying_take_profit_after_opening_position():
     assert t1.fee == 0
 
 
+def test_modifying_take_profit_in_place_after_opening_position():
+    single_route_backtest('Test48')
+
+    # the take-profit (LIMIT) order at 11 got canceled and resubmitted at 16
+    take_profit_orders = [
+        o for o in store.orders.get_orders(exchanges.SANDBOX, 'BTCUSD')
+        if o.role == order_roles.CLOSE_POSITION and o.type == order_types.LIMIT
+    ]
+    assert [(o.price, o.is_canceled, o.is_executed) for o in take_profit_orders] == [
+        (11, True, False),
+        (16, False, True),
+    ]
+
+    assert len(store.completed_trades.trades) == 1
+    t1: CompletedTrade = store.completed_trades.trades[0]
+    assert t1.entry_price == 7
+    assert t1.exit_price == 16
+    assert t1.take_profit_at == 16
+    assert t1.qty == 1.5
+
+
 def test_modifying_take_profit_after_part_of_position_is_already_reduced_with_profit():
     set_up([
         (exchanges.SANDBOX, 'BTCUSD', timeframes.MINUTE_1, 'Test13'),
@@ -901,6 +942,26 @@ def test_validation_for_equal_stop_loss_and_take_profit():
 
     assert str(err.value).startswith('stop-loss and take-profit should not be exactly the same')
 
+
+def test_modifying_entry_of_short_position_after_opening():
+    single_route_backtest('Test47')
+
+    # new entry points of a short position are submitted by the same rules as
+    # opening one: a LIMIT sell above the current price and a STOP sell below it
+    strategy = router.routes[0].strategy
+    assert strategy.vars['resubmitted_orders'] == [
+        (sides.SELL, order_types.LIMIT, 14),
+        (sides.SELL, order_types.STOP, 11),
+    ]
+
+    assert len(store.completed_trades.trades) == 1
+    t1: CompletedTrade = store.completed_trades.trades[0]
+    assert t1.type == 'short'
+    assert t1.entry_price == (10 + 14) / 2
+    assert t1.exit_price == 20
+    assert t1.qty == 2
+
+
 # def test_inputs_get_rounded_behind_the_scene():
 #     set_up([(exchanges.SANDBOX, 'EOSUSD', timeframes.MINUTE_1, 'Test44')])
 #     candles = {}
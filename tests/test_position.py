@@ -1,6 +1,6 @@
 import jesse.services.selectors as selectors
 from jesse.config import config, reset_config
-from jesse.enums import exchanges
+from jesse.enums import exchanges, position_states
 from jesse.models import Position
 from jesse.store import store
 
@@ -251,3 +251,37 @@ def test_open_position():
     assert p.entry_price == 50
     assert p.exit_price is None
     assert e.balance == 950
+
+
+def test_position_qty_abs():
+    set_up()
+
+    p = Position(exchanges.SANDBOX, 'BTCUSD', {'entry_price': 50, 'current_price': 50, 'qty': -2})
+    assert p.qty_abs == 2
+
+    p._reduce(1, 50)
+    assert p.qty == -1
+    assert p.qty_abs == 1
+
+    p.qty = 0
+    assert p.qty_abs == 0
+
+
+def test_position_state():
+    set_up()
+
+    p = Position(exchanges.SANDBOX, 'BTCUSD', {'entry_price': 50, 'current_price': 50})
+    assert p.state == position_states.CLOSE
+
+    p.qty = 2
+    assert p.state == position_states.OPEN | position_states.LONG
+
+    p.qty = -2
+    assert p.state == position_states.OPEN | position_states.SHORT
+    assert p.type == 'short'
+    assert p.is_open is True
+
+    p._close(50)
+    assert p.state == position_states.CLOSE
+    assert p.type == 'close'
+    assert p.is_close is True
@@ -1,3 +1,7 @@
+import threading
+import time
+
+import jesse.helpers as jh
 from jesse.config import config, reset_config
 from jesse.store import store
 from jesse.enums import exchanges
@@ -65,3 +69,26 @@ def test_state_order_get_order_by_id():
     store.orders.add_order(o2)
     assert store.orders.get_order_by_id(exchanges.SANDBOX, 'ETHUSD',
                                         o2.id) == o2
+
+
+def test_wait_for_no_active_orders(monkeypatch):
+    set_up()
+
+    # returns right away when there are no active orders
+    assert store.orders.wait_for_no_active_orders(exchanges.SANDBOX, 'BTCUSD', timeout=1) is True
+
+    o = fake_order()
+    store.orders.add_order(o)
+
+    # times out while the order is still active
+    assert store.orders.wait_for_no_active_orders(exchanges.SANDBOX, 'BTCUSD', timeout=0.05) is False
+
+    # in live mode, wakes up as soon as another thread cancels the order
+    monkeypatch.setattr(jh, 'is_live', lambda: True)
+    monkeypatch.setitem(config['env'], 'notifications', {'events': {'cancelled_orders': False}})
+    threading.Timer(0.05, o.cancel).start()
+    started_at = time.time()
+    assert store.orders.wait_for_no_active_orders(exchanges.SANDBOX, 'BTCUSD', timeout=5) is True
+    assert o.is_canceled
+    # woken up by the cancellation rather than by reaching the timeout
+    assert time.time() - started_at < 1
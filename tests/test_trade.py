@@ -1,6 +1,9 @@
+import numpy as np
+
 import jesse.helpers as jh
 from jesse.config import config, reset_config
-from jesse.models import CompletedTrade
+from jesse.enums import sides
+from jesse.models import CompletedTrade, Order
 from jesse.store import store
 
 
@@ -172,3 +175,24 @@ def test_can_add_trade_to_store():
     assert store.completed_trades.trades == [trade]
     store.reset()
     assert store.completed_trades.trades == []
+
+
+def test_completed_trade_entry_and_exit_stats():
+    trade = CompletedTrade({'type': 'long'})
+    trade.add_order(Order({'qty': 1, 'price': 10, 'side': sides.BUY}))
+    trade.add_order(Order({'qty': -1, 'price': 12, 'side': sides.SELL}))
+
+    assert len(trade.orders) == 2
+    assert trade.entry_and_exit_stats() == (1, 10, 12)
+
+    trade.add_order(Order({'qty': 3, 'price': 14, 'side': sides.BUY}))
+    trade.add_order(Order({'qty': -3, 'price': 16, 'side': sides.SELL}))
+    assert trade.entry_and_exit_stats() == (4, 13, 15)
+
+    # orders are split into entry and exit ones by the side of the opening order
+    short_trade = CompletedTrade({'type': 'short'})
+    short_trade.add_order(Order({'qty': -2, 'price': 20, 'side': sides.SELL}))
+    assert short_trade.entry_and_exit_stats()[:2] == (2, 20)
+    assert np.isnan(short_trade.entry_and_exit_stats()[2])
+    short_trade.add_order(Order({'qty': 2, 'price': 18, 'side': sides.BUY}))
+    assert short_trade.entry_and_exit_stats() == (2, 20, 18)